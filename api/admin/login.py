@@ -1,9 +1,8 @@
 """POST /api/admin/login - Admin authentication endpoint."""
-import json
 from http import HTTPStatus
 
-from ..utils.auth import verify_admin_password, create_admin_token
 from ..utils.responses import json_response, error_response, options_response
+from ..utils.serialization import loads, JSONDecodeError
 
 
 def handler(request):
@@ -14,9 +13,12 @@ def handler(request):
     if request.method != "POST":
         return error_response(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed")
 
+    # Deferred so preflights skip loading bcrypt and PyJWT
+    from ..utils.auth import verify_admin_password, create_admin_token
+
     try:
-        body = json.loads(request.body)
-    except (json.JSONDecodeError, TypeError):
+        body = loads(request.body)
+    except (JSONDecodeError, TypeError):
         return error_response(HTTPStatus.BAD_REQUEST, "Invalid JSON")
 
     password = body.get("password")
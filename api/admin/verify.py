@@ -1,7 +1,6 @@
 """GET /api/admin/verify - Verify admin token."""
 from http import HTTPStatus
 
-from ..utils.auth import verify_admin_token
 from ..utils.responses import json_response, error_response, options_response
 
 
@@ -13,6 +12,9 @@ def handler(request):
     if request.method != "GET":
         return error_response(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed")
 
+    # Deferred so preflights skip loading PyJWT
+    from ..utils.auth import verify_admin_token
+
     result = verify_admin_token(request)
     if result.success:
         return json_response(HTTPStatus.OK, {"valid": True})
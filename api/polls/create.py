@@ -1,20 +1,26 @@
 """POST /api/polls/create - Create a new poll."""
-import json
+import base64
 import secrets
-import string
 from http import HTTPStatus
 
-from ..utils.auth import verify_admin_token, hash_password
-from ..utils.db import get_supabase_client
 from ..utils.validation import validate_poll_data
 from ..utils.responses import json_response, error_response, options_response
+from ..utils.serialization import loads, JSONDecodeError
+
+# Retries when a generated access code collides with an existing poll
+MAX_ACCESS_CODE_ATTEMPTS = 5
+
+# Base32 has no 0/1; also drop letters easily confused with digits
+AMBIGUOUS_CHARS = str.maketrans("", "", "ilo")
 
 
 def generate_access_code(length: int = 8) -> str:
     """Generate a random alphanumeric access code."""
-    # Remove ambiguous characters
-    alphabet = "abcdefghjkmnpqrstuvwxyz23456789"
-    return "".join(secrets.choice(alphabet) for _ in range(length))
+    code = ""
+    while len(code) < length:
+        # 5 random bytes encode to exactly 8 base32 characters
+        code += base64.b32encode(secrets.token_bytes(5)).decode().lower().translate(AMBIGUOUS_CHARS)
+    return code[:length]
 
 
 def handler(request):
@@ -25,53 +31,57 @@ def handler(request):
     if request.method != "POST":
         return error_response(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed")
 
+    # Deferred so preflights skip loading Supabase, bcrypt and PyJWT
+    from postgrest.exceptions import APIError
+    from ..utils.auth import verify_admin_token, hash_password
+    from ..utils.db import get_supabase_client, is_unique_violation
+
     # Verify admin authentication
     auth_result = verify_admin_token(request)
     if not auth_result.success:
         return error_response(HTTPStatus.UNAUTHORIZED, auth_result.error or "Unauthorized")
 
     try:
-        body = json.loads(request.body)
-    except (json.JSONDecodeError, TypeError):
+        body = loads(request.body)
+    except (JSONDecodeError, TypeError):
         return error_response(HTTPStatus.BAD_REQUEST, "Invalid JSON")
 
+    title = body.get("title")
+    slug = body.get("slug")
+    password = body.get("password")
+
     # Validate input
-    validation = validate_poll_data(body)
+    validation = validate_poll_data(title, slug=slug, password=password)
     if not validation.valid:
         return error_response(HTTPStatus.BAD_REQUEST, ", ".join(validation.errors or []))
 
     supabase = get_supabase_client()
 
-    # Check slug availability if provided
-    slug = body.get("slug")
-    if slug:
-        existing = supabase.table("polls").select("id").eq("slug", slug).execute()
-        if existing.data:
-            return error_response(HTTPStatus.CONFLICT, "Slug already in use")
-
-    # Generate unique access code
-    access_code = generate_access_code()
-    while True:
-        existing = supabase.table("polls").select("id").eq("access_code", access_code).execute()
-        if not existing.data:
-            break
-        access_code = generate_access_code()
-
     # Create poll data
     poll_data = {
-        "title": body["title"],
+        "title": title,
         "slug": slug,
-        "access_code": access_code,
         "state": "draft"
     }
 
     # Hash password if provided
-    if body.get("password"):
-        poll_data["password_hash"] = hash_password(body["password"])
-
-    result = supabase.table("polls").insert(poll_data).execute()
+    if password:
+        poll_data["password_hash"] = hash_password(password)
+
+    # Insert directly, letting the unique indexes reject a taken slug or access code
+    result = None
+    for _ in range(MAX_ACCESS_CODE_ATTEMPTS):
+        poll_data["access_code"] = generate_access_code()
+        try:
+            result = supabase.table("polls").insert(poll_data).execute()
+            break
+        except APIError as e:
+            if is_unique_violation(e, "slug"):
+                return error_response(HTTPStatus.CONFLICT, "Slug already in use")
+            if not is_unique_violation(e, "access_code"):
+                raise
 
-    if result.data:
+    if result and result.data:
         poll = result.data[0]
         return json_response(HTTPStatus.CREATED, {
             "id": poll["id"],
@@ -1,11 +1,9 @@
 """POST /api/questions/create - Create a new question."""
-import json
 from http import HTTPStatus
 
-from ..utils.auth import verify_admin_token
-from ..utils.db import get_supabase_client
 from ..utils.validation import validate_question_data
 from ..utils.responses import json_response, error_response, options_response
+from ..utils.serialization import loads, JSONDecodeError
 
 
 def handler(request):
@@ -16,14 +14,18 @@ def handler(request):
     if request.method != "POST":
         return error_response(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed")
 
+    # Deferred so preflights skip loading Supabase and PyJWT
+    from ..utils.auth import verify_admin_token
+    from ..utils.db import get_supabase_client
+
     # Verify admin authentication
     auth_result = verify_admin_token(request)
     if not auth_result.success:
         return error_response(HTTPStatus.UNAUTHORIZED, auth_result.error or "Unauthorized")
 
     try:
-        body = json.loads(request.body)
-    except (json.JSONDecodeError, TypeError):
+        body = loads(request.body)
+    except (JSONDecodeError, TypeError):
         return error_response(HTTPStatus.BAD_REQUEST, "Invalid JSON")
 
     # Validate input
@@ -33,42 +35,15 @@ def handler(request):
 
     supabase = get_supabase_client()
 
-    poll_id = body["poll_id"]
-
-    # Verify poll exists
-    poll = supabase.table("polls").select("id").eq("id", poll_id).single().execute()
-    if not poll.data:
-        return error_response(HTTPStatus.NOT_FOUND, "Poll not found")
-
-    # Get next question order
-    existing_questions = supabase.table("questions").select("question_order").eq("poll_id", poll_id).order("question_order", desc=True).limit(1).execute()
-    next_order = (existing_questions.data[0]["question_order"] + 1) if existing_questions.data else 0
-
-    # Create question
-    question_result = supabase.table("questions").insert({
-        "poll_id": poll_id,
-        "question_text": body["question_text"],
-        "question_order": next_order,
-        "chart_type": body.get("chart_type", "horizontal_bar")
+    # Create question and answer options in a single round-trip
+    result = supabase.rpc("create_question_with_options", {
+        "p_poll_id": body["poll_id"],
+        "p_question_text": body["question_text"],
+        "p_chart_type": body.get("chart_type", "horizontal_bar"),
+        "p_options": [{"option_text": opt["option_text"]} for opt in body.get("answer_options") or []]
     }).execute()
 
-    if not question_result.data:
-        return error_response(HTTPStatus.INTERNAL_SERVER_ERROR, "Failed to create question")
-
-    question = question_result.data[0]
-
-    # Create answer options
-    answer_options = body.get("answer_options", [])
-    if answer_options:
-        options_data = [
-            {
-                "question_id": question["id"],
-                "option_text": opt["option_text"],
-                "option_order": i
-            }
-            for i, opt in enumerate(answer_options)
-        ]
-        options_result = supabase.table("answer_options").insert(options_data).execute()
-        question["answer_options"] = options_result.data
+    if not result.data:
+        return error_response(HTTPStatus.NOT_FOUND, "Poll not found")
 
-    return json_response(HTTPStatus.CREATED, question)
+    return json_response(HTTPStatus.CREATED, result.data[0])
@@ -1,9 +1,8 @@
 """POST /api/sessions/create - Create a participant session."""
-import json
 from http import HTTPStatus
 
-from ..utils.db import get_supabase_client
 from ..utils.responses import json_response, error_response, options_response
+from ..utils.serialization import loads, JSONDecodeError
 
 
 def handler(request):
@@ -14,9 +13,12 @@ def handler(request):
     if request.method != "POST":
         return error_response(HTTPStatus.METHOD_NOT_ALLOWED, "Method not allowed")
 
+    # Deferred so preflights skip building the Supabase client
+    from ..utils.db import get_supabase_client, execute_concurrently
+
     try:
-        body = json.loads(request.body)
-    except (json.JSONDecodeError, TypeError):
+        body = loads(request.body)
+    except (JSONDecodeError, TypeError):
         return error_response(HTTPStatus.BAD_REQUEST, "Invalid JSON")
 
     poll_id = body.get("poll_id")
@@ -27,16 +29,20 @@ def handler(request):
 
     supabase = get_supabase_client()
 
+    # Look up the poll and any existing session concurrently
+    poll, existing = execute_concurrently(
+        supabase.table("polls").select("state").eq("id", poll_id).single(),
+        supabase.table("sessions").select("id").eq("session_token", session_token)
+    )
+
     # Verify poll exists and is open
-    poll = supabase.table("polls").select("state").eq("id", poll_id).single().execute()
     if not poll.data:
         return error_response(HTTPStatus.NOT_FOUND, "Poll not found")
 
     if poll.data["state"] != "open":
         return error_response(HTTPStatus.FORBIDDEN, "Poll is not accepting responses")
 
-    # Check for existing session
-    existing = supabase.table("sessions").select("id").eq("session_token", session_token).execute()
+    # Return existing session
     if existing.data:
         return json_response(HTTPStatus.OK, {"session_id": existing.data[0]["id"]})
 
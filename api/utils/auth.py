@@ -1,11 +1,12 @@
 """Authentication utilities."""
 import os
 import hashlib
-from datetime import datetime, timedelta
+import hmac
+import time
 from typing import Optional, NamedTuple
 
 import bcrypt
-from jose import jwt, JWTError
+import jwt
 
 
 class AuthResult(NamedTuple):
@@ -16,31 +17,56 @@ class AuthResult(NamedTuple):
 JWT_SECRET = os.environ.get("JWT_SECRET", "dev-secret-change-me")
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRY_HOURS = 24
+JWT_EXPIRY_SECONDS = JWT_EXPIRY_HOURS * 3600
+JWT_CLAIMS = {"sub": "admin"}
+
+# bcrypt cost factor for poll passwords
+BCRYPT_ROUNDS = int(os.environ.get("BCRYPT_ROUNDS", "10"))
+
+# Recently verified tokens, mapped to the time their cache entry expires
+TOKEN_CACHE_TTL_SECONDS = 15
+TOKEN_CACHE_MAX_SIZE = 1024
+_token_cache: dict[str, float] = {}
 
 
 def verify_admin_password(password: str) -> bool:
-    """Verify the admin master password using SHA256 hash."""
+    """Verify the admin master password against a SHA256 or bcrypt hash."""
     stored_hash = os.environ.get("ADMIN_PASSWORD_HASH")
     if not stored_hash:
         # In development, allow a default password
         return password == "admin"
 
-    # Use SHA256 for admin password (produces alphanumeric hex string)
-    password_hash = hashlib.sha256(password.encode()).hexdigest()
-    return password_hash == stored_hash
+    # Accept bcrypt hashes for deployments configured per the README
+    if stored_hash.startswith("$2"):
+        return verify_password(password, stored_hash)
+
+    # Use SHA256 for admin password (stored as a hex string)
+    try:
+        stored_digest = bytes.fromhex(stored_hash)
+    except ValueError:
+        return False
+
+    return hmac.compare_digest(hashlib.sha256(password.encode()).digest(), stored_digest)
 
 
 def create_admin_token() -> str:
     """Create a JWT token for admin authentication."""
-    expires = datetime.utcnow() + timedelta(hours=JWT_EXPIRY_HOURS)
+    now = int(time.time())
     payload = {
-        "sub": "admin",
-        "exp": expires,
-        "iat": datetime.utcnow()
+        **JWT_CLAIMS,
+        "exp": now + JWT_EXPIRY_SECONDS,
+        "iat": now
     }
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 
+def _cache_token(token: str, expires_at: float) -> None:
+    """Remember a verified token, evicting the oldest entry when full."""
+    if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+        del _token_cache[next(iter(_token_cache))]
+    _token_cache[token] = expires_at
+
+
 def verify_admin_token(request) -> AuthResult:
     """Verify the admin JWT token from request headers."""
     auth_header = request.headers.get("Authorization", "")
@@ -50,18 +76,28 @@ def verify_admin_token(request) -> AuthResult:
 
     token = auth_header[7:]  # Remove "Bearer " prefix
 
+    now = time.time()
+    cached_until = _token_cache.get(token)
+    if cached_until is not None:
+        if now < cached_until:
+            return AuthResult(success=True)
+        _token_cache.pop(token, None)
+
     try:
         payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
         if payload.get("sub") != "admin":
             return AuthResult(success=False, error="Invalid token subject")
+        # Never serve a token from cache past its own expiry
+        cached_until = now + TOKEN_CACHE_TTL_SECONDS
+        _cache_token(token, min(cached_until, payload.get("exp", cached_until)))
         return AuthResult(success=True)
-    except JWTError as e:
+    except jwt.PyJWTError as e:
         return AuthResult(success=False, error=f"Token verification failed: {str(e)}")
 
 
 def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
 
 
 def verify_password(password: str, password_hash: str) -> bool:
@@ -1,23 +1,55 @@
 """Supabase database client utilities."""
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from postgrest.exceptions import APIError
+from postgrest.utils import SyncClient
 from supabase import create_client, Client
 
-_client: Client | None = None
+SUPABASE_URL = os.environ.get("SUPABASE_URL")
+SUPABASE_SERVICE_KEY = os.environ.get("SUPABASE_SERVICE_KEY")
 
+# Postgres error code for unique constraint violations
+UNIQUE_VIOLATION = "23505"
+
+# Keep connections to PostgREST open between warm invocations
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50, keepalive_expiry=60)
+
+# Worker threads for issuing independent queries concurrently
+_executor = ThreadPoolExecutor(max_workers=8)
 
-def get_supabase_client() -> Client:
-    """Get or create a Supabase client instance."""
-    global _client
-    if _client is None:
-        url = os.environ.get("SUPABASE_URL")
-        key = os.environ.get("SUPABASE_SERVICE_KEY")
 
-        if not url or not key:
-            raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
+def _build() -> Client | None:
+    """Build the service-role client with a keep-alive connection pool."""
+    if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
+        return None
 
-        _client = create_client(url, key)
+    client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
 
-    return _client
+    # supabase-py 2.3 has no option for injecting an httpx client, so swap the
+    # PostgREST session for one with the same settings plus our pool limits.
+    session = client.postgrest.session
+    client.postgrest.session = SyncClient(
+        base_url=session.base_url,
+        headers=session.headers,
+        timeout=session.timeout,
+        limits=HTTP_LIMITS,
+    )
+    session.close()
+
+    return client
+
+
+SUPABASE = _build()
+
+
+def get_supabase_client() -> Client:
+    """Get the shared Supabase client instance."""
+    if SUPABASE is None:
+        raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
+
+    return SUPABASE
 
 
 def get_anon_client() -> Client:
@@ -29,3 +61,14 @@ def get_anon_client() -> Client:
         raise ValueError("SUPABASE_URL and SUPABASE_ANON_KEY must be set")
 
     return create_client(url, key)
+
+
+def is_unique_violation(error: APIError, column: str) -> bool:
+    """Check whether an API error is a unique violation on the given column."""
+    return error.code == UNIQUE_VIOLATION and column in (error.message or "")
+
+
+def execute_concurrently(*queries) -> list:
+    """Execute independent queries in parallel, returning responses in order."""
+    futures = [_executor.submit(query.execute) for query in queries]
+    return [future.result() for future in futures]
@@ -1,20 +1,33 @@
 """HTTP response utilities for Vercel serverless functions."""
-import json
 from http import HTTPStatus
 from typing import Any
 
+from .serialization import dumps
+
+# Header dicts are shared across responses and must not be mutated
+CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, PATCH, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization"
+}
+
+JSON_HEADERS = {
+    "Content-Type": "application/json",
+    **CORS_HEADERS
+}
+
+OPTIONS_HEADERS = {
+    **CORS_HEADERS,
+    "Access-Control-Max-Age": "86400"
+}
+
 
 def json_response(status: HTTPStatus, data: Any) -> dict:
     """Create a JSON response for Vercel serverless functions."""
     return {
         "statusCode": status.value,
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, PUT, PATCH, DELETE, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type, Authorization"
-        },
-        "body": json.dumps(data)
+        "headers": JSON_HEADERS,
+        "body": dumps(data)
     }
 
 
@@ -27,11 +40,6 @@ def options_response() -> dict:
     """Handle CORS preflight requests."""
     return {
         "statusCode": 204,
-        "headers": {
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, PUT, PATCH, DELETE, OPTIONS",
-            "Access-Control-Allow-Headers": "Content-Type, Authorization",
-            "Access-Control-Max-Age": "86400"
-        },
+        "headers": OPTIONS_HEADERS,
         "body": ""
     }
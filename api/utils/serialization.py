@@ -0,0 +1,17 @@
+"""JSON serialization utilities (orjson when available, stdlib json otherwise)."""
+try:
+    import orjson
+
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(data) -> str:
+        """Serialize data to a JSON string."""
+        return orjson.dumps(data).decode()
+
+except ImportError:
+    import json
+
+    loads = json.loads
+    dumps = json.dumps
+    JSONDecodeError = json.JSONDecodeError
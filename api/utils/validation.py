@@ -8,30 +8,36 @@ class ValidationResult(NamedTuple):
     errors: Optional[List[str]] = None
 
 
-def validate_poll_data(data: dict) -> ValidationResult:
-    """Validate poll creation/update data."""
+# Shared result for valid input (immutable, so safe to reuse)
+VALID = ValidationResult(valid=True)
+
+SLUG_PATTERN = re.compile(r"^[a-z0-9-]+$")
+CHART_TYPES = frozenset({"horizontal_bar", "vertical_bar", "pie", "donut"})
+
+
+def validate_poll_data(
+    title: Optional[str], slug: Optional[str] = None, password: Optional[str] = None
+) -> ValidationResult:
+    """Validate poll creation/update fields."""
     errors = []
 
-    title = data.get("title")
     if not title or not isinstance(title, str):
         errors.append("Title is required")
     elif len(title) > 255:
         errors.append("Title must be 255 characters or less")
 
-    slug = data.get("slug")
     if slug:
         if not isinstance(slug, str):
             errors.append("Slug must be a string")
-        elif not re.match(r"^[a-z0-9-]+$", slug):
+        elif not SLUG_PATTERN.match(slug):
             errors.append("Slug can only contain lowercase letters, numbers, and hyphens")
         elif len(slug) > 100:
             errors.append("Slug must be 100 characters or less")
 
-    password = data.get("password")
     if password and len(password) < 4:
         errors.append("Password must be at least 4 characters")
 
-    return ValidationResult(valid=len(errors) == 0, errors=errors if errors else None)
+    return ValidationResult(valid=False, errors=errors) if errors else VALID
 
 
 def validate_question_data(data: dict) -> ValidationResult:
@@ -47,7 +53,7 @@ def validate_question_data(data: dict) -> ValidationResult:
         errors.append("Question text is required")
 
     chart_type = data.get("chart_type")
-    if chart_type and chart_type not in ["horizontal_bar", "vertical_bar", "pie", "donut"]:
+    if chart_type and (not isinstance(chart_type, str) or chart_type not in CHART_TYPES):
         errors.append("Invalid chart type")
 
     answer_options = data.get("answer_options")
@@ -61,7 +67,7 @@ def validate_question_data(data: dict) -> ValidationResult:
                 if not isinstance(opt, dict) or not opt.get("option_text"):
                     errors.append(f"Answer option {i + 1} must have option_text")
 
-    return ValidationResult(valid=len(errors) == 0, errors=errors if errors else None)
+    return ValidationResult(valid=False, errors=errors) if errors else VALID
 
 
 def validate_response_data(data: dict) -> ValidationResult:
@@ -83,4 +89,4 @@ def validate_response_data(data: dict) -> ValidationResult:
     if has_multi and not isinstance(has_multi, list):
         errors.append("answer_option_ids must be a list")
 
-    return ValidationResult(valid=len(errors) == 0, errors=errors if errors else None)
+    return ValidationResult(valid=False, errors=errors) if errors else VALID
@@ -0,0 +1,91 @@
+-- Submit a participant response in a single round-trip
+-- Validates session, poll state, question and answer options, then writes the response(s)
+
+CREATE OR REPLACE FUNCTION submit_response(
+    p_session_token TEXT,
+    p_question_id UUID,
+    p_answer_option_ids UUID[],
+    p_multiple BOOLEAN DEFAULT FALSE
+)
+RETURNS TABLE (result TEXT, missing_option_id UUID) AS $$
+DECLARE
+    v_session_id UUID;
+    v_poll_id UUID;
+    v_poll_state TEXT;
+    v_allow_multiple BOOLEAN;
+    v_missing_option_id UUID;
+BEGIN
+    -- Verify session exists and its poll is open
+    SELECT s.id, s.poll_id, p.state
+    INTO v_session_id, v_poll_id, v_poll_state
+    FROM sessions s
+    JOIN polls p ON p.id = s.poll_id
+    WHERE s.session_token = p_session_token;
+
+    IF NOT FOUND THEN
+        RETURN QUERY SELECT 'session_not_found'::TEXT, NULL::UUID;
+        RETURN;
+    END IF;
+
+    IF v_poll_state != 'open' THEN
+        RETURN QUERY SELECT 'poll_not_open'::TEXT, NULL::UUID;
+        RETURN;
+    END IF;
+
+    -- Verify question belongs to poll
+    SELECT q.allow_multiple INTO v_allow_multiple
+    FROM questions q
+    WHERE q.id = p_question_id AND q.poll_id = v_poll_id;
+
+    IF NOT FOUND THEN
+        RETURN QUERY SELECT 'question_not_found'::TEXT, NULL::UUID;
+        RETURN;
+    END IF;
+
+    IF p_multiple AND NOT COALESCE(v_allow_multiple, FALSE) THEN
+        RETURN QUERY SELECT 'multiple_not_allowed'::TEXT, NULL::UUID;
+        RETURN;
+    END IF;
+
+    -- Verify all answer options belong to question
+    SELECT t.opt_id INTO v_missing_option_id
+    FROM unnest(p_answer_option_ids) WITH ORDINALITY AS t(opt_id, ord)
+    WHERE NOT EXISTS (
+        SELECT 1 FROM answer_options ao
+        WHERE ao.id = t.opt_id AND ao.question_id = p_question_id
+    )
+    ORDER BY t.ord
+    LIMIT 1;
+
+    IF FOUND THEN
+        RETURN QUERY SELECT 'option_not_found'::TEXT, v_missing_option_id;
+        RETURN;
+    END IF;
+
+    IF p_multiple THEN
+        -- Replace existing responses with one row per selected option
+        DELETE FROM responses r
+        WHERE r.session_id = v_session_id AND r.question_id = p_question_id;
+
+        INSERT INTO responses (session_id, question_id, answer_option_id)
+        SELECT DISTINCT v_session_id, p_question_id, t.opt_id
+        FROM unnest(p_answer_option_ids) AS t(opt_id);
+    ELSE
+        -- Update existing response, or insert a new one
+        UPDATE responses r
+        SET answer_option_id = p_answer_option_ids[1]
+        WHERE r.id = (
+            SELECT e.id FROM responses e
+            WHERE e.session_id = v_session_id AND e.question_id = p_question_id
+            LIMIT 1
+        );
+
+        IF NOT FOUND THEN
+            INSERT INTO responses (session_id, question_id, answer_option_id)
+            VALUES (v_session_id, p_question_id, p_answer_option_ids[1]);
+        END IF;
+    END IF;
+
+    RETURN QUERY SELECT 'ok'::TEXT, NULL::UUID;
+END;
+$$ LANGUAGE plpgsql;
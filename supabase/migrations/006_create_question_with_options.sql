@@ -0,0 +1,50 @@
+-- Create a question and its answer options in a single round-trip
+-- Returns the new question (with answer_options when given), or no rows if the poll does not exist
+
+CREATE OR REPLACE FUNCTION create_question_with_options(
+    p_poll_id UUID,
+    p_question_text TEXT,
+    p_chart_type TEXT DEFAULT 'horizontal_bar',
+    p_options JSONB DEFAULT '[]'::JSONB
+)
+RETURNS SETOF JSONB AS $$
+DECLARE
+    v_question questions%ROWTYPE;
+    v_result JSONB;
+BEGIN
+    -- Verify poll exists
+    PERFORM 1 FROM polls WHERE id = p_poll_id;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    -- Create question at the next order position
+    INSERT INTO questions (poll_id, question_text, question_order, chart_type)
+    VALUES (
+        p_poll_id,
+        p_question_text,
+        COALESCE((SELECT MAX(question_order) + 1 FROM questions WHERE poll_id = p_poll_id), 0),
+        COALESCE(p_chart_type, 'horizontal_bar')
+    )
+    RETURNING * INTO v_question;
+
+    v_result := to_jsonb(v_question);
+
+    -- Create answer options
+    IF jsonb_array_length(p_options) > 0 THEN
+        WITH inserted AS (
+            INSERT INTO answer_options (question_id, option_text, option_order)
+            SELECT v_question.id, opt ->> 'option_text', (ord - 1)::INTEGER
+            FROM jsonb_array_elements(p_options) WITH ORDINALITY AS t(opt, ord)
+            RETURNING *
+        )
+        SELECT v_result || jsonb_build_object(
+            'answer_options', jsonb_agg(to_jsonb(inserted) ORDER BY inserted.option_order)
+        )
+        INTO v_result
+        FROM inserted;
+    END IF;
+
+    RETURN NEXT v_result;
+END;
+$$ LANGUAGE plpgsql;
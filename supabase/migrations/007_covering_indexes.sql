@@ -0,0 +1,14 @@
+-- Covering indexes for the hot lookups in submit_response
+-- Lets session-by-token and existing-response probes run as index-only scans
+
+-- Session lookup by token returns id and poll_id straight from the index
+CREATE UNIQUE INDEX IF NOT EXISTS idx_sessions_token_covering
+    ON sessions(session_token) INCLUDE (id, poll_id);
+
+-- Superseded by the covering index (and duplicated the UNIQUE constraint's index)
+DROP INDEX IF EXISTS idx_sessions_token;
+
+-- Existing-response probe by session and question
+-- Not unique: multi-select questions store one row per selected option
+CREATE INDEX IF NOT EXISTS idx_responses_session_question
+    ON responses(session_id, question_id) INCLUDE (id);